@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+Coeur du générateur d'entités Doctrine : modèle, rendus et sorties.
+Ne dépend ni de wb, ni de grt, ni de mforms et peut donc être importé
+en dehors de MySQL Workbench
+"""
+
+from .metadata import Annotation, Attribute, Comment
+from .model import Column, ForeignKey, Index, InvertedKey, Relations, Table
+from .naming import DEFAULT_IRREGULAR_PLURALS, DEFAULT_PLURAL_RULES, Naming, underscoreToCamelcase
+from .renderers import (
+    RENDERERS,
+    AnnotationRenderer,
+    AttributeRenderer,
+    EntityRenderer,
+    MappingRenderer,
+    Renderer,
+    XmlRenderer,
+    YamlRenderer,
+    createRenderers,
+)
+from .schema import Schema
+from .writers import ArchiveWriter, DirectoryWriter, StreamWriter, createWriter
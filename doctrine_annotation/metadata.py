@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Classe permettant de générer des annotations
+"""
+class Annotation:
+    def __init__(self):
+        self._default_prefix = "@ORM\\"
+        self.prefix = self._default_prefix
+
+    def setPrefix(self, prefix):
+        self.prefix = prefix
+
+    def resetPrefix(self):
+        self.prefix = self._default_prefix
+
+    def get(self, name, value = None):
+        def quoted(value):
+            if isinstance(value, bool):
+                return "true" if value else "false"
+            elif isinstance(value, basestring) and value[0:len(self.prefix)] != self.prefix:
+                return '"' + value + '"'
+            elif isinstance(value, dict):
+                return "{" + buildDict(value) + "}"
+            elif isinstance(value, list):
+                return "{" + ", ".join([quoted(val) for val in value]) + "}"
+            else:
+                return str(value)
+
+        def buildDict(datas):
+            return ", ".join([key + '=' + quoted(value) for key, value in datas.iteritems()])
+
+        annotation = self.prefix + name
+
+        if isinstance(value, dict):
+            annotation += "(" + buildDict(value) + ")"
+        elif isinstance(value, list):
+            annotation += "(" + quoted(value) + ")"
+
+        return annotation
+
+
+"""
+Classe permettant de générer des attributs PHP 8
+"""
+class Attribute:
+    def __init__(self):
+        self._default_prefix = "ORM\\"
+        self.prefix = self._default_prefix
+
+    def setPrefix(self, prefix):
+        self.prefix = prefix
+
+    def resetPrefix(self):
+        self.prefix = self._default_prefix
+
+    def get(self, name, value = None):
+        def quoted(value):
+            if isinstance(value, bool):
+                return "true" if value else "false"
+            elif isinstance(value, basestring) and value.endswith("::class"):
+                return value
+            elif isinstance(value, basestring):
+                return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+            elif isinstance(value, dict):
+                return "[" + ", ".join([quoted(key) + " => " + quoted(val) for key, val in value.iteritems()]) + "]"
+            elif isinstance(value, list):
+                return "[" + ", ".join([quoted(val) for val in value]) + "]"
+            else:
+                return str(value)
+
+        attribute = self.prefix + name
+
+        if isinstance(value, dict) and value:
+            attribute += "(" + ", ".join([key + ": " + quoted(val) for key, val in value.iteritems()]) + ")"
+
+        return "#[" + attribute + "]"
+
+
+"""
+Classe permettant de générer des commentaires
+"""
+class Comment:
+    def __init__(self, comments, prefix = "    "):
+        self.comments = comments
+        self.prefix = prefix
+        self.eol = "\n"
+
+    def build(self):
+        result = self.get("/**", False)
+        for comment in self.comments:
+            result += self.get(comment)
+        result += self.get(" */", False)
+        return result
+
+    def get(self, text, content = True):
+        return self.prefix + (" * " if content else "") + text + self.eol
+
+
+a_ = Annotation()
+at_ = Attribute()
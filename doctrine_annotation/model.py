@@ -0,0 +1,720 @@
+# -*- coding: utf-8 -*-
+
+import re
+import json
+
+from .metadata import a_, Comment
+
+
+class ForeignKey:
+    def __init__(self, foreign_key, namespace, naming):
+        self.foreign_key = foreign_key
+        self.namespace = namespace
+        self.naming = naming
+        self.name = foreign_key.columns[0].name
+        self.many_to_one = (foreign_key.many == 1)
+        self.columns = [column.name for column in foreign_key.columns]
+        self.table = foreign_key.columns[0].owner.name
+        self.origin_table = foreign_key.referencedTable.name
+        self.origin_columns = [column.name for column in foreign_key.referencedColumns]
+        # Identité de la contrainte : plusieurs clés peuvent commencer par la même colonne
+        self.constraint = foreign_key.name or ", ".join(self.columns)
+        self.type = ''
+        self.setType()
+        if self.isComposite():
+            self.property = self.origin_table
+        else:
+            # Remove "_id"
+            self.property = self.name[0:len(self.name) - 3]
+
+    def getLocals(self):
+        return self.columns
+
+    def getForeigns(self):
+        return [{'table': self.origin_table, 'column': column} for column in self.origin_columns]
+
+    def isManyToOne(self):
+        return self.many_to_one
+
+    def getName(self):
+        return self.name
+
+    def getConstraint(self):
+        return self.constraint
+
+    def isComposite(self):
+        return len(self.columns) > 1
+
+    def getInverseType(self):
+        if self.many_to_one:
+            return 'OneToMany'
+        return 'OneToOne'
+
+    def setType(self):
+        # Une clé sur plusieurs colonnes reste une seule association (JoinColumns)
+        if self.foreign_key.many == 1:
+            self.type = 'ManyToOne'
+        else:
+            self.type = 'OneToOne'
+
+    def getTargetEntity(self):
+        return self.naming.className(self.origin_table)
+
+    def getMapping(self):
+        return {'targetEntity': self.namespace + '\\' + self.getTargetEntity(), 'inversedBy': self.naming.plural(self.table)}
+
+    def getJoinColumns(self):
+        return [{'name': column, 'referencedColumnName': origin_column} for column, origin_column in zip(self.columns, self.origin_columns)]
+
+    def buildAnnotation(self):
+        annotations = []
+        annotations += [a_.get(self.type, self.getMapping())]
+        join_columns = [a_.get('JoinColumn', join_column) for join_column in self.getJoinColumns()]
+        if self.isComposite():
+            annotations += [a_.get('JoinColumns', join_columns)]
+        else:
+            annotations += join_columns
+        return annotations
+
+
+class Table:
+    def __init__(self, table, namespace, naming, relations):
+        self.table = table
+        self.name = table.name
+        self.namespace = namespace
+        self.naming = naming
+        self.relations = relations
+        self.columns = []
+        self.indexes = []
+        self.primaries = set()
+        self.uniques = set()
+        self.foreigns = {}
+        self.foreign_columns = {}
+        self.hasTimestamps = False
+        self._initForeigns()
+        self._initIndexes()
+        self._initColumns()
+
+    def _initIndexes(self):
+        for index in self.table.indices:
+            idx = Index(index)
+            if idx.isPrimary():
+                self.primaries.update(idx.getColumns())
+            elif idx.isUnique() and len(idx.getColumns()) == 1:
+                # Les index uniques composites restent des UniqueConstraint de la table
+                self.uniques.update(idx.getColumns())
+            self.indexes += [idx]
+
+    def _initColumns(self):
+        composite = self.hasCompositePrimary()
+        for column in self.table.columns:
+            if column.name == 'created_at' or column.name == 'updated_at':
+                self.hasTimestamps = True
+            keys = self.foreign_columns.get(column.name, [])
+            # Chaque clé étrangère est portée par sa première colonne, les autres
+            # colonnes de la clé sont portées par l'association
+            owners = [key for key in keys if key.name == column.name]
+            if keys and not owners:
+                continue
+            for key in owners or [None]:
+                col = Column(column, self.naming)
+                if key is None:
+                    primary = column.name in self.primaries
+                else:
+                    # Une association ne fait partie de l'identifiant que si
+                    # toutes ses colonnes sont dans la clé primaire
+                    primary = self.primaries.issuperset(key.columns)
+                if primary:
+                    col.markAsPrimary(composite)
+                if column.name in self.uniques:
+                    col.markAsUnique()
+                if key is not None:
+                    col.markAsForeign(key)
+                self.columns += [col]
+
+    def _initForeigns(self):
+        for fks in self.relations.getOutgoing(self.name):
+            self.foreigns[fks.constraint] = fks
+            for column in fks.columns:
+                self.foreign_columns.setdefault(column, []).append(fks)
+
+    def hasCompositePrimary(self):
+        return len(self.primaries) > 1
+
+    def getColumns(self):
+        return self.columns
+
+    def getIndexes(self):
+        return self.indexes
+
+    def registerNames(self):
+        self.naming.registerClass(self.name)
+        for column in self.columns:
+            self.naming.registerProperty(self.name, column.property, column.getSource(), column.getAccessors())
+        for key in self.getInvertedKeys():
+            self.naming.registerProperty(self.name, key.property, "Relation " + key.foreign.table + "." + key.foreign.constraint, key.getAccessors())
+        writers = {}
+        for column in self.columns:
+            if column.is_foreign:
+                for name in column.foreign_key.columns:
+                    writers.setdefault(name, []).append(column.foreign_key.constraint)
+        for column in self.table.columns:
+            constraints = writers.get(column.name, [])
+            if len(constraints) > 1:
+                self.naming.registerSharedColumn(self.name, column.name, constraints)
+        for column, constraints in self.getUnmappedPrimaries():
+            self.naming.registerUnmappedPrimary(self.name, column, constraints)
+
+    """
+    Retourne les colonnes de la clé primaire qui ne font partie d'aucun
+    identifiant généré, avec les clés étrangères qui les portent
+    """
+    def getUnmappedPrimaries(self):
+        mapped = set()
+        for column in self.columns:
+            if column.is_primary:
+                mapped.update(column.foreign_key.columns if column.is_foreign else [column.name])
+        return [(column.name, [key.constraint for key in self.foreign_columns.get(column.name, [])])
+                for column in self.table.columns if column.name in self.primaries and column.name not in mapped]
+
+    def getForeignsKey(self):
+        return self.foreigns
+
+    def getInvertedKeys(self):
+        return self.relations.getInvertedKeys(self.name)
+
+    def hasInvertedKeys(self):
+        return self.relations.hasInvertedKeys(self.name)
+
+
+"""
+Classe indexant les relations du schéma : pour chaque table, les clés
+étrangères sortantes et entrantes, avec leur cardinalité
+"""
+class Relations:
+    def __init__(self, namespace, naming):
+        self.namespace = namespace
+        self.naming = naming
+        self.tables = []
+        self.edges = []
+        self.outgoing = {}
+        self.incoming = {}
+        self.inverted = {}
+
+    """
+    Indexe les clés étrangères de la table (objet grt) passée en argument
+    """
+    def addTable(self, table):
+        self.tables.append(table.name)
+        keys = self.outgoing.setdefault(table.name, [])
+        for foreign_key in table.foreignKeys:
+            key = ForeignKey(foreign_key, self.namespace, self.naming)
+            keys.append(key)
+            self.edges.append(key)
+            self.incoming.setdefault(key.origin_table, []).append(key)
+            if key.many_to_one:
+                self.inverted.setdefault(key.origin_table, []).append(InvertedKey(key, self.naming))
+
+    def getOutgoing(self, table_name):
+        return self.outgoing.get(table_name, [])
+
+    def getIncoming(self, table_name):
+        return self.incoming.get(table_name, [])
+
+    def getInvertedKeys(self, table_name):
+        return self.inverted.get(table_name, [])
+
+    def hasInvertedKeys(self, table_name):
+        return table_name in self.inverted
+
+    """
+    Retourne les instructions use (sans doublon) des entités liées à la table
+    """
+    def getUses(self, table_name):
+        uses = []
+        for key in self.getInvertedKeys(table_name):
+            use = key.getUse()
+            if use not in uses:
+                uses.append(use)
+        return uses
+
+    def getEdges(self):
+        return self.edges
+
+    """
+    Retourne le graphe des relations sous forme de dictionnaire
+    """
+    def toDict(self):
+        return {
+            "tables": list(self.tables),
+            "relations": [{
+                "name": key.constraint,
+                "from": key.table,
+                "to": key.origin_table,
+                "columns": key.columns,
+                "referencedColumns": key.origin_columns,
+                "cardinality": key.type,
+                "inverse": key.getInverseType(),
+            } for key in self.edges],
+        }
+
+    def toJson(self):
+        return json.dumps(self.toDict(), indent=4, sort_keys=True, separators=(",", ": "))
+
+    """
+    Retourne le graphe des relations au format DOT (Graphviz)
+    """
+    def toDot(self, name = "schema"):
+        def quoted(value):
+            return '"' + value.replace('"', '\\"') + '"'
+
+        content = "digraph " + quoted(name) + " {\n"
+        for table in self.tables:
+            content += "    " + quoted(table) + ";\n"
+        for key in self.edges:
+            label = key.constraint + ": " + ", ".join(key.columns) + " (" + key.type + ")"
+            content += "    " + quoted(key.table) + " -> " + quoted(key.origin_table) + " [label=" + quoted(label) + "];\n"
+        content += "}\n"
+        return content
+
+
+class Index:
+    def __init__(self, index):
+        self.index = index
+        self.name = index.name
+        self.type = index.indexType
+        self.columns = [column.referencedColumn.name for column in index.columns]
+
+    def isPrimary(self):
+        return self.type == "PRIMARY"
+
+    def isUnique(self):
+        return self.type == "UNIQUE"
+
+    def isIndex(self):
+        return self.type == "INDEX"
+
+    def getColumns(self):
+        return self.columns
+
+    def getMapping(self):
+        return {
+            "name": self.name,
+            "columns": self.getColumns()
+        }
+
+    def toAnnotation(self, annotation):
+        return a_.get(annotation, self.getMapping())
+
+
+class InvertedKey:
+    def __init__(self, key, naming):
+        self.foreign = key
+        self.naming = naming
+        self.property = naming.plural(key.table)
+        self.entity = naming.className(key.table)
+        self.origin_entity = naming.className(key.origin_table)
+
+    def getAccessors(self):
+        return [
+            self.naming.accessor("get", self.property),
+            self.naming.accessor("set", self.property),
+            self.naming.accessor("add", self.foreign.table),
+            self.naming.accessor("remove", self.foreign.table),
+        ]
+
+    def getMapping(self):
+        return {'targetEntity': self.foreign.namespace + '\\' + self.entity, 'mappedBy': self.foreign.property}
+
+    def buildAnnotations(self):
+        annotations = ["@var ArrayCollection"]
+        annotations += [a_.get('OneToMany', self.getMapping())]
+        commentary = Comment(annotations)
+        return commentary.build()
+
+    def buildSetter(self):
+        annotations = ["Set the value of " + self.property, "@param  ArrayCollection     $" + self.property, "@return self"]
+        commentary = Comment(annotations)
+        setter = commentary.build()
+        setter += "    public function " + self.naming.accessor("set", self.property) + "(ArrayCollection $" + self.property + ")\n"
+        setter += "    {\n"
+        setter += "        $this->" + self.property + " = $" + self.property + ";\n"
+        setter += "        return $this;\n"
+        setter += "    }\n\n\n"
+        return setter
+
+    def buildAdder(self):
+        table = self.foreign.table
+        annotations = ["Add a " + self.entity + " into " + self.origin_entity, "@param  " + self.entity + "     $" + table, "@return self"]
+        commentary = Comment(annotations)
+        adder = commentary.build()
+        adder += "    public function " + self.naming.accessor("add", table) + "(" + self.entity + " $" + table + ")\n"
+        adder += "    {\n"
+        adder += "        if ($this->" + self.property + "->contains($" + table + ") === false) {\n"
+        adder += "            $this->" + self.property + "->add($" + table + ");\n"
+        adder += "            $" + table + "->" + self.naming.accessor("set", self.foreign.property) + "($this);\n"
+        adder += "        }\n"
+        adder += "        return $this;\n"
+        adder += "    }\n\n\n"
+        return adder
+
+    def buildRemover(self):
+        table = self.foreign.table
+        annotations = ["Remove a " + self.entity + " into " + self.origin_entity, "@param  " + self.entity + "     $" + table, "@return self"]
+        commentary = Comment(annotations)
+        adder = commentary.build()
+        adder += "    public function " + self.naming.accessor("remove", table) + "(" + self.entity + " $" + table + ")\n"
+        adder += "    {\n"
+        adder += "        if ($this->" + self.property + "->contains($" + table + ") === true) {\n"
+        adder += "            $this->" + self.property + "->remove($" + table + ");\n"
+        adder += "            $" + table + "->" + self.naming.accessor("set", self.foreign.property) + "(null);\n"
+        adder += "        }\n"
+        adder += "        return $this;\n"
+        adder += "    }\n\n\n"
+        return adder
+
+    def buildGetter(self):
+        commentary = Comment(["Get the value of " + self.property, "@return " + self.naming.camelcase(self.property) + "[]"])
+        getter = commentary.build()
+        getter += "    public function " + self.naming.accessor("get", self.property) + "()\n"
+        getter += "    {\n"
+        getter += "        return $this->" + self.property + ";\n"
+        getter += "    }\n\n\n"
+        return getter
+
+    def getUse(self):
+        return "use " + self.foreign.namespace + '\\' + self.entity + ";\n";
+
+    def buildProperty(self):
+        return "    protected $" + self.property + ";\n\n"
+
+    def buildConstructor(self):
+        return "        $this->" + self.property + " = new ArrayCollection();\n"
+
+
+class Column:
+    def __init__(self, column, naming):
+        self.column = column
+        self.naming = naming
+        self.name = column.name
+        self.property = column.name
+        self.type = column.simpleType if column.simpleType else column.userType
+        self.flags = column.flags
+        self.is_primary = False
+        self.is_composite_primary = False
+        self.is_unique = False
+        self.is_foreign = False
+        self.foreign_key = None
+        self.doctrine_types = {
+            "TINYINT": "integer",
+            "SMALLINT": "integer",
+            "MEDIUMINT": "integer",
+            "INT": "integer",
+            "BIGINT": "integer",
+            "FLOAT": "float",
+            "DOUBLE": "float",
+            "float": "float",
+            "CHAR": "string",
+            "VARCHAR": "string",
+            "BINARY": "string",
+            "VARBINARY": "string",
+            "TINYTEXT": "string",
+            "TEXT": "string",
+            "MEDIUMTEXT": "string",
+            "LONGTEXT": "string",
+            "TINYBLOB": "string",
+            "BLOB": "string",
+            "MEDIUMBLOB": "string",
+            "LONGBLOB": "string",
+            "DATETIME": "datetime",
+            "DATE": "datetime",
+            "TIME": "datetime",
+            "YEAR": "integer",
+            "TIMESTAMP": "datetime",
+            "GEOMETRY": "object",
+            "LINESTRING": "object",
+            "POLYGON": "object",
+            "MULTIPOINT": "object",
+            "MULTILINESTRING": "object",
+            "MULTIPOLYGON": "object",
+            "GEOMETRYCOLLECTION": "object",
+            "BIT": "integer",
+            "ENUM": "string",
+            "SET": "string",
+            "BOOLEAN": "boolean",
+            "BOOL": "boolean",
+            "FIXED": "float",
+            "FLOAT4": "float",
+            "FLOAT8": "float",
+            "INT1": "integer",
+            "INT2": "integer",
+            "INT3": "integer",
+            "INT4": "integer",
+            "INT8": "integer",
+            "INTEGER": "integer",
+            "LONGVARBINARY": "string",
+            "LONGVARCHAR": "string",
+            "LONG": "integer",
+            "MIDDLEINT": "integer",
+            "NUMERIC": "float",
+            "DEC": "float",
+            "CHARACTER": "string"
+        }
+        self.php_types = {
+            "TINYINT": "int",
+            "SMALLINT": "int",
+            "MEDIUMINT": "int",
+            "INT": "int",
+            "BIGINT": "int",
+            "FLOAT": "float",
+            "DOUBLE": "float",
+            "float": "float",
+            "CHAR": "string",
+            "VARCHAR": "string",
+            "BINARY": "string",
+            "VARBINARY": "string",
+            "TINYTEXT": "string",
+            "TEXT": "string",
+            "MEDIUMTEXT": "string",
+            "LONGTEXT": "string",
+            "TINYBLOB": "string",
+            "BLOB": "string",
+            "MEDIUMBLOB": "string",
+            "LONGBLOB": "string",
+            "DATETIME": "\DateTime",
+            "DATE": "\DateTime",
+            "TIME": "\DateTime",
+            "YEAR": "int",
+            "TIMESTAMP": "\DateTime",
+            "GEOMETRY": "object",
+            "LINESTRING": "object",
+            "POLYGON": "object",
+            "MULTIPOINT": "object",
+            "MULTILINESTRING": "object",
+            "MULTIPOLYGON": "object",
+            "GEOMETRYCOLLECTION": "object",
+            "BIT": "int",
+            "ENUM": "string",
+            "SET": "string",
+            "BOOLEAN": "bool",
+            "BOOL": "bool",
+            "FIXED": "float",
+            "FLOAT4": "float",
+            "FLOAT8": "float",
+            "INT1": "int",
+            "INT2": "int",
+            "INT3": "int",
+            "INT4": "int",
+            "INT8": "int",
+            "INTEGER": "int",
+            "LONGVARBINARY": "string",
+            "LONGVARCHAR": "string",
+            "LONG": "int",
+            "MIDDLEINT": "int",
+            "NUMERIC": "float",
+            "DEC": "float",
+            "CHARACTER": "string"
+        }
+
+    def _getDoctrineType(self):
+        return self.doctrine_types.get(self.type.name, "string")
+
+    def _getPhpType(self):
+        if self.is_foreign == False:
+            return self.php_types.get(self.type.name, "string")
+        return self.naming.className(self.foreign_key.origin_table)
+
+    def _isUnsigned(self):
+        return "UNSIGNED" in self.column.flags
+
+    def _isAutoIncrement(self):
+        return self.column.autoIncrement == 1
+
+    def _isNotNull(self):
+        return self.column.isNotNull == 1
+
+    def _getLength(self):
+        return self.column.length if self.column.length != -1 else None
+
+    def _getPrecision(self):
+        return self.column.precision if self.column.precision != -1 else None
+
+    def _getParameters(self):
+        return self.column.datatypeExplicitParams if self.column.datatypeExplicitParams else None
+
+    def _getFinalName(self):
+        return self.property
+
+    def markAsPrimary(self, composite = False):
+        self.is_primary = True
+        self.is_composite_primary = composite
+
+    def markAsUnique(self):
+        self.is_unique = True
+
+    def markAsForeign(self, foreign_key):
+        self.is_foreign = True
+        self.foreign_key = foreign_key
+        self.property = foreign_key.property
+
+    def getAccessors(self):
+        return [self.naming.accessor("get", self.property), self.naming.accessor("set", self.property)]
+
+    def getSource(self):
+        if self.is_foreign:
+            return "Relation " + self.foreign_key.constraint
+        return "Column " + self.name
+
+    def hasDefaultValue(self):
+        if self.column.defaultValueIsNull == 1:
+            return True
+        if self.column.defaultValue != "":
+            return True
+        return False
+
+    def getDefaultValue(self):
+        if self.column.defaultValueIsNull == 1:
+            return "null"
+        if self._getPhpType() == "bool":
+            if self.column.defaultValue == "1":
+                return "true"
+            else:
+                return "false"
+        if self._getPhpType() == "string":
+            default_value = self.column.defaultValue
+            default_value = re.sub("^'", "", default_value)
+            default_value = re.sub("'$", "", default_value)
+            default_value = default_value.replace("'", "\\'")
+            return "'" + default_value + "'"
+        if self._getPhpType() == "\DateTime":
+            return "new \DateTime(\"" + self.column.defaultValue + "\")"
+        return self.column.defaultValue
+
+    def getConstructor(self):
+        return "        $this->" + self._getFinalName() + " = " + self.getDefaultValue() + ";\n"
+
+    def isGenerated(self):
+        # Doctrine ne supporte pas de génération de valeur sur une clé composite
+        return self._isAutoIncrement() and not self.is_composite_primary
+
+    def getComment(self):
+        return self.column.comment
+
+    def getVarType(self):
+        return self._getPhpType()
+
+    """
+    Retourne la définition Doctrine de la colonne (type, length, nullable...)
+    """
+    def getMapping(self):
+        def_column = {"type": self._getDoctrineType()}
+        if self._getLength():
+            def_column["length"] = int(self._getLength())
+        if not self._isNotNull():
+            def_column["nullable"] = True
+        if self.is_unique:
+            def_column["unique"] = True
+        if self._getPrecision():
+            def_column["precision"] = self._getPrecision()
+        if self._isUnsigned():
+            def_column["options"] = {"unsigned": True}
+        return def_column
+
+    """
+    Retourne la liste des contraintes de validation (nom, paramètres) de la colonne
+    """
+    def getAssertions(self):
+        assertions = []
+
+        if self.is_primary:
+            return assertions
+
+        if self._getLength():
+            assertions += [("Length", {"min": 0, "max": self._getLength()})]
+        if self._isNotNull() and self._getPhpType() != "string":
+            assertions += [("NotNull", {})]
+        if self._isNotNull() and self._getPhpType() == "string":
+            assertions += [("NotBlank", {})]
+        if self._isUnsigned():
+            assertions += [("GreaterThanOrEqual", {"value": 0})]
+        if self.name == "email":
+            assertions += [("Email", {})]
+        if self._getPhpType() == "int" or self._getPhpType() == "float":
+            assertions += [("Type", {"type": "numeric"})]
+        if self._getPhpType() == "string":
+            assertions += [("Type", {"type": "string"})]
+        if self._getPhpType() == "\DateTime":
+            assertions += [("DateTime", {})]
+
+        return assertions
+
+    def getAnnotations(self):
+        annotations = []
+
+        if self.column.comment != "":
+            annotations += [self.column.comment]
+            annotations += [""]
+
+        annotations += ["@var " + self._getPhpType()]
+
+        if self.is_primary:
+            annotations += [a_.get("Id")]
+        def_column = self.getMapping()
+        if "options" in def_column:
+            def_column["options"] = dict(("\"" + key + "\"", value) for key, value in def_column["options"].items())
+
+        annotations += [a_.get("Column", def_column)]
+
+        if self.isGenerated():
+            annotations += [a_.get("GeneratedValue", {"strategy": "AUTO"})]
+
+        annotations += self.getAssertAnnotation()
+
+        if self.is_foreign:
+            annotations = self.foreign_key.buildAnnotation()
+            if self.is_primary:
+                annotations = [a_.get("Id")] + annotations
+
+        commentary = Comment(annotations)
+        return commentary.build()
+
+    def getAssertAnnotation(self):
+        a_.setPrefix("@Assert\\")
+        annotations = [a_.get(name, params) for name, params in self.getAssertions()]
+        a_.resetPrefix()
+        return annotations
+
+    def getProperty(self):
+        return "    protected $" + self._getFinalName() + ";\n"
+
+    def getGetter(self):
+        commentary = Comment(["Get the value of " + self._getFinalName(), "@return " + self._getPhpType()])
+        result = commentary.build()
+        result += "    public function " + self.naming.accessor("get", self._getFinalName()) + "()\n"
+        result += "    {\n"
+        result += "        return $this->" + self._getFinalName() + ";\n"
+        result += "    }\n\n"
+        return result
+
+    def getSetter(self):
+        commentary = Comment(["Set the value of " + self._getFinalName(), "@param " + self._getPhpType() + " $" + self._getFinalName(), "@return self"])
+        result = commentary.build()
+        result += "    public function " + self.naming.accessor("set", self._getFinalName()) + "($" + self._getFinalName() + ")\n"
+        result += "    {\n"
+        result += "        $this->" + self._getFinalName() + " = $" + self._getFinalName() + ";\n"
+        result += "        return $this;\n"
+        result += "    }\n\n"
+        return result
+
+    def getToString(self):
+        if self.name != 'name':
+            return ''
+
+        commentary = Comment(['Return the name when show the object', '@return string'])
+        result = commentary.build()
+        result += "    public function __toString()\n"
+        result += "    {\n"
+        result += "        return $this->getName() ?: '-';\n"
+        result += "    }\n\n"
+
+        return result
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+
+"""
+Règles de mise au pluriel par défaut : liste ordonnée de couples
+(expression régulière, remplacement), la première règle qui correspond est appliquée
+"""
+DEFAULT_PLURAL_RULES = [
+    ("y$", "ies"),
+    ("$", "s"),
+]
+
+"""
+Pluriels irréguliers par défaut (singulier => pluriel)
+"""
+DEFAULT_IRREGULAR_PLURALS = {}
+
+
+"""
+Classe calculant une seule fois par schéma les noms de classes, de propriétés,
+d'accesseurs et les pluriels, et détectant les collisions de noms
+"""
+class Naming:
+    def __init__(self, plural_rules = None, irregular_plurals = None):
+        if plural_rules is None:
+            plural_rules = DEFAULT_PLURAL_RULES
+        self.plural_rules = [(re.compile(pattern), replacement) for pattern, replacement in plural_rules]
+        self.irregular_plurals = dict(DEFAULT_IRREGULAR_PLURALS)
+        if irregular_plurals:
+            self.irregular_plurals.update(irregular_plurals)
+        # Noms de classes et pluriels (calculés sur les noms de tables) : communs au schéma
+        self.class_names = {}
+        self.plurals = {}
+        # Noms des propriétés et accesseurs : propres à la table en cours, vidés par release()
+        self.camelcases = {}
+        self.accessors = {}
+        self.classes = {}
+        self.members = {}
+        self.collisions = []
+        self.class_collisions = set()
+        self.warnings = []
+
+    """
+    Retourne le nom de la classe pour la table passée en argument
+    """
+    def className(self, table_name):
+        try:
+            return self.class_names[table_name]
+        except KeyError:
+            result = self.class_names[table_name] = underscoreToCamelcase(table_name)
+            return result
+
+    def camelcase(self, value):
+        try:
+            return self.camelcases[value]
+        except KeyError:
+            result = self.camelcases[value] = underscoreToCamelcase(value)
+            return result
+
+    def plural(self, value):
+        try:
+            return self.plurals[value]
+        except KeyError:
+            result = self.plurals[value] = self._inflect(value)
+            return result
+
+    """
+    Retourne le nom de l'accesseur (get, set, add, remove...) pour la propriété passée en argument
+    """
+    def accessor(self, prefix, value):
+        key = (prefix, value)
+        try:
+            return self.accessors[key]
+        except KeyError:
+            result = self.accessors[key] = prefix + self.camelcase(value)
+            return result
+
+    def _inflect(self, value):
+        # Les pluriels irréguliers s'appliquent au dernier mot de la chaine
+        head, separator, word = value.rpartition("_")
+        if word in self.irregular_plurals:
+            return head + separator + self.irregular_plurals[word]
+
+        for pattern, replacement in self.plural_rules:
+            if pattern.search(value):
+                return pattern.sub(replacement, value, 1)
+        return value
+
+    """
+    Enregistre le nom de classe d'une table et signale les collisions
+    (les noms de classes PHP ne sont pas sensibles à la casse)
+    """
+    def registerClass(self, table_name):
+        class_name = self.className(table_name)
+        other = self.classes.setdefault(class_name.lower(), table_name)
+        # Une table peut être enregistrée plusieurs fois (mode streaming) :
+        # chaque collision n'est signalée qu'une fois
+        if other != table_name and (other, table_name) not in self.class_collisions:
+            self.class_collisions.add((other, table_name))
+            self.collisions.append("Tables {0} and {1} both generate the class {2}".format(other, table_name, class_name))
+        return class_name
+
+    """
+    Enregistre une propriété et ses accesseurs dans la classe d'une table
+    et signale les collisions
+    """
+    def registerProperty(self, table_name, property, source, accessors):
+        members = self.members.setdefault(table_name, {})
+        names = [("property $" + property, property)]
+        names += [("method " + accessor + "()", accessor.lower() + "()") for accessor in accessors]
+        for label, key in names:
+            other = members.setdefault(key, source)
+            if other != source:
+                self.collisions.append("{0} and {1} both generate the {2} in {3}".format(other, source, label, self.className(table_name)))
+
+    """
+    Oublie les membres et les noms de propriétés d'une table déjà générée
+    (les collisions de propriétés ne concernent qu'une même classe) : en mode
+    streaming, seuls les noms de classes et les pluriels restent en mémoire
+    """
+    def release(self, table_name):
+        self.members.pop(table_name, None)
+        self.camelcases.clear()
+        self.accessors.clear()
+
+    """
+    Signale une colonne écrite par plusieurs associations : Doctrine refuse
+    qu'une même colonne soit persistée par plusieurs JoinColumn
+    """
+    def registerSharedColumn(self, table_name, column, constraints):
+        self.warnings.append("Column {0} of {1} is written by the relations {2} : keep it in only one of these foreign keys".format(column, self.className(table_name), ", ".join(constraints)))
+
+    """
+    Signale une colonne de la clé primaire portée par une clé étrangère qui
+    ne fait que partiellement partie de la clé primaire
+    """
+    def registerUnmappedPrimary(self, table_name, column, constraints):
+        self.warnings.append("Primary key column {0} of {1} is mapped by the relations {2}, which are only partly in the primary key : it is left out of the identifier".format(column, self.className(table_name), ", ".join(constraints)))
+
+    def getCollisions(self):
+        return self.collisions
+
+    def hasCollisions(self):
+        return len(self.collisions) > 0
+
+    """
+    Retourne les avertissements sur le mapping des relations
+    (ce ne sont pas des collisions de noms)
+    """
+    def getWarnings(self):
+        return self.warnings
+
+
+"""
+Modification d'une chaine avec underscore en CamelCase
+
+:param:     string  value   La chaine à convertir
+:return:    string          La chaine au format CamelCase
+"""
+def underscoreToCamelcase(value):
+    def camelcase(): 
+        yield str.lower
+        while True:
+            yield str.capitalize
+
+    c = camelcase()
+    result = "".join(c.next()(x) if x else '_' for x in value.split("_"))
+    return result[0].upper() + result[1:]
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+
+import re
+import string
+from xml.sax.saxutils import escape, quoteattr
+
+from .metadata import a_, at_, Comment
+
+
+"""
+Classe de base des rendus : un rendu transforme une table en un fichier.
+Tous les rendus d'un schéma partagent le même parcours des tables
+"""
+class Renderer:
+    name = ""
+    extension = ""
+
+    def __init__(self, directory = ""):
+        self.directory = directory
+        self.schema = None
+        self.namespace = None
+        self.naming = None
+        self.relations = None
+
+    def attach(self, schema):
+        self.schema = schema
+        self.namespace = schema.namespace
+        self.naming = schema.naming
+        self.relations = schema.relations
+
+    def getFilename(self, table):
+        filename = self.getBasename(table) + self.extension
+        if self.directory:
+            return self.directory.rstrip("/") + "/" + filename
+        return filename
+
+    def getBasename(self, table):
+        return self.naming.className(table.name)
+
+    def render(self, table):
+        raise NotImplementedError()
+
+    @staticmethod
+    def convertStr(data):
+        if isinstance(data, str):
+            return unicode(data, "utf-8")
+        return data
+
+
+"""
+Classe de base des rendus générant les classes PHP des entités, les
+métadonnées (annotations, attributs) étant fournies par les classes filles
+"""
+class EntityRenderer(Renderer):
+    extension = ".php"
+
+    def render(self, table):
+        return self.buildClass(table)
+
+    """
+    Contruction de la classe pour la table passée en argument
+    """
+    def buildClass(self, table):
+        convertStr = self.convertStr
+
+        content = ""
+        properties = ""
+        content_key = ""
+        constructor = ""
+        getters = ""
+        setters = ""
+        to_string = ""
+
+        content += self.buildHeader(table)
+
+        for column in table.getColumns():
+            properties += convertStr(self.buildProperties(column))
+            getters += self.buildGetter(column)
+            setters += self.buildSetter(column)
+            to_string += column.getToString()
+            if column.hasDefaultValue():
+                constructor += column.getConstructor()
+
+        for key in self.relations.getInvertedKeys(table.name):
+            content_key += self.buildInvertedMetadata(key)
+            content_key += key.buildProperty()
+            constructor += key.buildConstructor()
+            setters     += key.buildSetter()
+            setters     += key.buildAdder()
+            setters     += key.buildRemover()
+            getters     += key.buildGetter()
+
+        if constructor != "":
+            content_constructor = constructor
+            constructor  = Comment(["Constructor of the " + self.naming.className(table.name) + " class"]).build()
+            constructor += "    public function __construct()\n"
+            constructor += "    {\n"
+            constructor += "{0}".format(content_constructor)
+            constructor += "    }\n\n"
+
+        content += convertStr(properties) + convertStr(content_key) + convertStr(constructor)
+        content += convertStr(to_string) + convertStr(getters) + convertStr(setters)
+
+        if table.hasTimestamps == True:
+            content += convertStr(self.buildTimestamps(table))
+
+        content = content.strip(string.whitespace)
+
+        content += convertStr(self.buildFooter(table))
+
+        return content.strip(string.whitespace)
+
+    """
+    Contruction du header de la classe pour la table passée en argument
+    """
+    def buildHeader(self, table):
+        content = "<?php\n\n"
+        content += "namespace {0};\n\n".format(self.namespace)
+        content += "use Doctrine\ORM\Mapping as ORM;\n"
+        content += "use Symfony\Component\Validator\Constraints as Assert;\n"
+        if self.relations.hasInvertedKeys(table.name):
+            content += "use Doctrine\Common\Collections\ArrayCollection;\n"
+            for use in self.relations.getUses(table.name):
+                content += use
+        content += "\n"
+
+        content += self.buildClassMetadata(table)
+        content +=  "class {0}\n".format(self.naming.className(table.name))
+        content +=  "{\n"
+
+        return content
+
+    """
+    Contruction du footer de la classe pour la table passée en argument
+    """
+    def buildFooter(self, table):
+        return "\n}"
+
+    """
+    Contruction de la variable pour la colonne passée en argument
+    """
+    def buildProperties(self, column):
+        return self.buildColumnMetadata(column) + column.getProperty() + "\n"
+
+
+    """
+    Contruction du getter pour la colonne passée en argument
+    """
+    def buildGetter(self, column):
+        return column.getGetter() + "\n"
+
+    """
+    Contruction du setter pour la colonne passée en argument
+    """
+    def buildSetter(self, column):
+        return column.getSetter() + "\n"
+
+    def buildTimestamps(self, table):
+        timestamps  = self.buildTimestampsMetadata()
+        timestamps += "    public function updatedTimestamps()\n"
+        timestamps += "    {\n"
+        timestamps += "        $this->setUpdatedAt(new \DateTime());\n"
+        timestamps += "        if ($this->getCreatedAt() === null) {\n"
+        timestamps += "            $this->setCreatedAt(new \DateTime());\n"
+        timestamps += "        }\n"
+        timestamps += "    }\n\n"
+        return timestamps
+
+    def buildClassMetadata(self, table):
+        raise NotImplementedError()
+
+    def buildColumnMetadata(self, column):
+        raise NotImplementedError()
+
+    def buildInvertedMetadata(self, key):
+        raise NotImplementedError()
+
+    def buildTimestampsMetadata(self):
+        raise NotImplementedError()
+
+
+"""
+Classe générant les entités avec des annotations Doctrine dans les docblocks
+"""
+class AnnotationRenderer(EntityRenderer):
+    name = "annotation"
+
+    def buildClassMetadata(self, table):
+        header_comment = [
+            self.naming.className(table.name),
+            "",
+            a_.get("Table", {
+                "name": table.name,
+                "indexes": [index.toAnnotation("Index") for index in table.getIndexes() if index.isIndex()],
+                "uniqueConstraints": [index.toAnnotation("UniqueConstraint") for index in table.getIndexes() if index.isUnique()],
+            }),
+            a_.get("Entity")
+        ]
+
+        if table.hasTimestamps == True:
+            header_comment += [a_.get("HasLifecycleCallbacks")]
+
+        return Comment(header_comment, "").build()
+
+    def buildColumnMetadata(self, column):
+        return column.getAnnotations()
+
+    def buildInvertedMetadata(self, key):
+        return key.buildAnnotations()
+
+    def buildTimestampsMetadata(self):
+        return Comment([a_.get("PrePersist"), a_.get("PreUpdate")]).build()
+
+
+"""
+Classe générant les entités avec des attributs PHP 8
+"""
+class AttributeRenderer(EntityRenderer):
+    name = "attribute"
+
+    def buildAttributes(self, attributes, prefix = "    "):
+        return "".join(prefix + attribute + "\n" for attribute in attributes)
+
+    def buildClassMetadata(self, table):
+        attributes = [at_.get("Entity"), at_.get("Table", {"name": table.name})]
+        attributes += [at_.get("Index", index.getMapping()) for index in table.getIndexes() if index.isIndex()]
+        attributes += [at_.get("UniqueConstraint", index.getMapping()) for index in table.getIndexes() if index.isUnique()]
+
+        if table.hasTimestamps == True:
+            attributes += [at_.get("HasLifecycleCallbacks")]
+
+        return Comment([self.naming.className(table.name)], "").build() + self.buildAttributes(attributes, "")
+
+    def buildColumnMetadata(self, column):
+        comments = []
+        if column.getComment() != "":
+            comments += [column.getComment(), ""]
+        comments += ["@var " + column.getVarType()]
+
+        attributes = []
+        if column.is_foreign:
+            key = column.foreign_key
+            if column.is_primary:
+                attributes += [at_.get("Id")]
+            attributes += [at_.get(key.type, {"targetEntity": key.getTargetEntity() + "::class", "inversedBy": key.getMapping()["inversedBy"]})]
+            attributes += [at_.get("JoinColumn", join_column) for join_column in key.getJoinColumns()]
+        else:
+            if column.is_primary:
+                attributes += [at_.get("Id")]
+            attributes += [at_.get("Column", column.getMapping())]
+            if column.isGenerated():
+                attributes += [at_.get("GeneratedValue", {"strategy": "AUTO"})]
+            at_.setPrefix("Assert\\")
+            attributes += [at_.get(name, params) for name, params in column.getAssertions()]
+            at_.resetPrefix()
+
+        return Comment(comments).build() + self.buildAttributes(attributes)
+
+    def buildInvertedMetadata(self, key):
+        attributes = [at_.get("OneToMany", {"targetEntity": key.entity + "::class", "mappedBy": key.getMapping()["mappedBy"]})]
+        return Comment(["@var ArrayCollection"]).build() + self.buildAttributes(attributes)
+
+    def buildTimestampsMetadata(self):
+        return self.buildAttributes([at_.get("PrePersist"), at_.get("PreUpdate")])
+
+
+"""
+Classe de base des rendus de fichiers de mapping (XML, YAML) : construit une
+description ordonnée de l'entité, mise en forme par les classes filles
+"""
+class MappingRenderer(Renderer):
+    column_options = ["type", "length", "nullable", "unique", "precision"]
+
+    def getBasename(self, table):
+        return self.namespace.replace("\\", ".") + "." + self.naming.className(table.name)
+
+    def getEntityName(self, name):
+        return self.namespace + "\\" + self.naming.className(name)
+
+    def getColumnOptions(self, column):
+        mapping = column.getMapping()
+        options = [(option, mapping[option]) for option in self.column_options if option in mapping]
+        return options, mapping.get("options", {})
+
+    def render(self, table):
+        return self.convertStr(self.buildMapping(table))
+
+    def buildMapping(self, table):
+        raise NotImplementedError()
+
+
+"""
+Classe générant les fichiers de mapping XML Doctrine
+"""
+class XmlRenderer(MappingRenderer):
+    name = "xml"
+    extension = ".dcm.xml"
+
+    def element(self, tag, attributes = None, children = None, depth = 0):
+        indent = "    " * depth
+        result = indent + "<" + tag
+        for name, value in (attributes or []):
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            result += " " + name + "=" + quoteattr(str(value) if not isinstance(value, basestring) else value)
+        if not children:
+            return result + "/>\n"
+        return result + ">\n" + "".join(children) + indent + "</" + tag + ">\n"
+
+    def buildOptions(self, options, depth):
+        if not options:
+            return []
+        children = []
+        for name, value in options.items():
+            value = ("true" if value else "false") if isinstance(value, bool) else str(value)
+            children += ["    " * (depth + 1) + "<option name=" + quoteattr(name) + ">" + escape(value) + "</option>\n"]
+        return [self.element("options", None, children, depth)]
+
+    def buildMapping(self, table):
+        depth = 2
+        children = []
+
+        indexes = [self.element("index", [("name", index.name), ("columns", ",".join(index.getColumns()))], None, depth + 1) for index in table.getIndexes() if index.isIndex()]
+        if indexes:
+            children += [self.element("indexes", None, indexes, depth)]
+        uniques = [self.element("unique-constraint", [("name", index.name), ("columns", ",".join(index.getColumns()))], None, depth + 1) for index in table.getIndexes() if index.isUnique()]
+        if uniques:
+            children += [self.element("unique-constraints", None, uniques, depth)]
+
+        if table.hasTimestamps == True:
+            callbacks = [self.element("lifecycle-callback", [("type", event), ("method", "updatedTimestamps")], None, depth + 1) for event in ["prePersist", "preUpdate"]]
+            children += [self.element("lifecycle-callbacks", None, callbacks, depth)]
+
+        ids = []
+        fields = []
+        associations = {}
+        for column in table.getColumns():
+            if column.is_foreign:
+                key = column.foreign_key
+                join_columns = [self.element("join-column", [("name", join_column["name"]), ("referenced-column-name", join_column["referencedColumnName"])], None, depth + 2) for join_column in key.getJoinColumns()]
+                if column.is_primary:
+                    ids += [self.element("id", [("name", column.property), ("association-key", True)], None, depth)]
+                kind = XmlRenderer.dasherize(key.type)
+                associations.setdefault(kind, []).append(self.element(kind, [
+                    ("field", column.property),
+                    ("target-entity", self.getEntityName(key.origin_table)),
+                    ("inversed-by", key.getMapping()["inversedBy"]),
+                ], [self.element("join-columns", None, join_columns, depth + 1)], depth))
+                continue
+
+            options, extra = self.getColumnOptions(column)
+            attributes = [("name", column.property)] + options[0:1] + [("column", column.name)] + options[1:]
+            sub = []
+            if column.is_primary and column.isGenerated():
+                sub += [self.element("generator", [("strategy", "AUTO")], None, depth + 1)]
+            sub += self.buildOptions(extra, depth + 1)
+            if column.is_primary:
+                ids += [self.element("id", attributes, sub, depth)]
+            else:
+                fields += [self.element("field", attributes, sub, depth)]
+
+        for key in self.relations.getInvertedKeys(table.name):
+            associations.setdefault("one-to-many", []).append(self.element("one-to-many", [
+                ("field", key.property),
+                ("target-entity", self.getEntityName(key.foreign.table)),
+                ("mapped-by", key.getMapping()["mappedBy"]),
+            ], None, depth))
+
+        # Ordre imposé par la séquence du XSD doctrine-mapping
+        children += ids + fields
+        for kind in ["one-to-one", "one-to-many", "many-to-one", "many-to-many"]:
+            children += associations.get(kind, [])
+
+        entity = self.element("entity", [("name", self.getEntityName(table.name)), ("table", table.name)], children, 1)
+
+        content  = "<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+        content += "<doctrine-mapping xmlns=\"http://doctrine-project.org/schemas/orm/doctrine-mapping\"\n"
+        content += "                  xmlns:xsi=\"http://www.w3.org/2001/XMLSchema-instance\"\n"
+        content += "                  xsi:schemaLocation=\"http://doctrine-project.org/schemas/orm/doctrine-mapping https://www.doctrine-project.org/schemas/orm/doctrine-mapping.xsd\">\n"
+        content += entity
+        content += "</doctrine-mapping>\n"
+        return content
+
+    @staticmethod
+    def dasherize(value):
+        return re.sub("([a-z])([A-Z])", "\\1-\\2", value).lower()
+
+
+"""
+Classe générant les fichiers de mapping YAML Doctrine
+"""
+class YamlRenderer(MappingRenderer):
+    name = "yaml"
+    extension = ".dcm.yml"
+
+    def scalar(self, value):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, basestring):
+            return "'" + value.replace("'", "''") + "'"
+        if isinstance(value, list):
+            return "[" + ", ".join(self.scalar(val) for val in value) + "]"
+        return str(value)
+
+    """
+    Mise en forme d'une liste ordonnée de couples (clé, valeur), une valeur
+    étant elle-même une liste de couples pour un sous-niveau
+    """
+    def dump(self, pairs, depth = 0):
+        result = ""
+        for key, value in pairs:
+            result += "    " * depth + key + ":"
+            if isinstance(value, list) and value and isinstance(value[0], tuple):
+                result += "\n" + self.dump(value, depth + 1)
+            else:
+                result += " " + self.scalar(value) + "\n"
+        return result
+
+    def buildMapping(self, table):
+        entity = [("type", "entity"), ("table", table.name)]
+
+        indexes = [(self.scalar(index.name), [("columns", index.getColumns())]) for index in table.getIndexes() if index.isIndex()]
+        if indexes:
+            entity += [("indexes", indexes)]
+        uniques = [(self.scalar(index.name), [("columns", index.getColumns())]) for index in table.getIndexes() if index.isUnique()]
+        if uniques:
+            entity += [("uniqueConstraints", uniques)]
+
+        ids = []
+        fields = []
+        associations = {}
+        for column in table.getColumns():
+            if column.is_foreign:
+                key = column.foreign_key
+                join_columns = [(self.scalar(join_column["name"]), [("referencedColumnName", join_column["referencedColumnName"])]) for join_column in key.getJoinColumns()]
+                kind = key.type[0].lower() + key.type[1:]
+                if column.is_primary:
+                    ids += [(self.scalar(column.property), [("associationKey", True)])]
+                associations.setdefault(kind, []).append((self.scalar(column.property), [
+                    ("targetEntity", self.getEntityName(key.origin_table)),
+                    ("inversedBy", key.getMapping()["inversedBy"]),
+                    ("joinColumns", join_columns),
+                ]))
+                continue
+
+            options, extra = self.getColumnOptions(column)
+            definition = options[0:1] + [("column", column.name)] + options[1:]
+            if extra:
+                definition += [("options", [(self.scalar(name), value) for name, value in extra.items()])]
+            if column.is_primary:
+                if column.isGenerated():
+                    definition += [("generator", [("strategy", "AUTO")])]
+                ids += [(self.scalar(column.property), definition)]
+            else:
+                fields += [(self.scalar(column.property), definition)]
+
+        for key in self.relations.getInvertedKeys(table.name):
+            associations.setdefault("oneToMany", []).append((self.scalar(key.property), [
+                ("targetEntity", self.getEntityName(key.foreign.table)),
+                ("mappedBy", key.getMapping()["mappedBy"]),
+            ]))
+
+        if ids:
+            entity += [("id", ids)]
+        if fields:
+            entity += [("fields", fields)]
+        for kind in ["oneToOne", "manyToOne", "oneToMany", "manyToMany"]:
+            if kind in associations:
+                entity += [(kind, associations[kind])]
+
+        if table.hasTimestamps == True:
+            entity += [("lifecycleCallbacks", [("prePersist", ["updatedTimestamps"]), ("preUpdate", ["updatedTimestamps"])])]
+
+        return self.dump([(self.scalar(self.getEntityName(table.name)), entity)])
+
+
+RENDERERS = [AnnotationRenderer, AttributeRenderer, XmlRenderer, YamlRenderer]
+
+"""
+Retourne les rendus correspondant aux noms passés en argument
+(annotation, attribute, xml, yaml). Lorsque plusieurs rendus sont demandés,
+chacun écrit dans un sous-répertoire portant son nom
+
+:param:     list    names   Les noms des rendus
+:return:    list            Les rendus à utiliser
+"""
+def createRenderers(names):
+    classes = dict((renderer.name, renderer) for renderer in RENDERERS)
+    names = [name.strip().lower() for name in names if name.strip()]
+    for name in names:
+        if name not in classes:
+            raise ValueError("Unknown renderer {0}".format(name))
+    if len(names) == 1:
+        return [classes[names[0]]()]
+    return [classes[name](name) for name in names]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from .model import Relations, Table
+from .naming import Naming
+from .renderers import AnnotationRenderer
+from .writers import DirectoryWriter
+
+
+"""
+Classe permettant de manipuler le schema de la base de données
+"""
+class Schema:
+    def __init__(self, schema, basepath, namespace, naming = None, writer = None, renderers = None, streaming = False):
+        self.schema = schema
+        self.tables = schema.tables
+        self.basepath = basepath
+        self.namespace = namespace
+        self.naming = naming if naming is not None else Naming()
+        self.writer = writer if writer is not None else DirectoryWriter(basepath)
+        self.renderers = renderers if renderers is not None else [AnnotationRenderer()]
+        self.relations = Relations(self.namespace, self.naming)
+        for renderer in self.renderers:
+            renderer.attach(self)
+        self.streaming = streaming
+        self.error = None
+        self.dico_table = {}
+        if self.streaming:
+            self._initRelations()
+        else:
+            self._initDico()
+
+    def _initDico(self):
+        # Un seul parcours : les relations de chaque table sont indexées
+        # (dans les deux sens) au moment où la table est construite
+        for table in self.tables:
+            self.relations.addTable(table)
+            self.dico_table[table.name] = Table(table, self.namespace, self.naming, self.relations)
+        for table in self.dico_table.values():
+            table.registerNames()
+
+    """
+    Premier parcours du mode streaming : seules les relations et les noms de
+    classes sont collectés, les tables sont construites une à une lors de la génération
+    """
+    def _initRelations(self):
+        for table in self.tables:
+            self.relations.addTable(table)
+            self.naming.registerClass(table.name)
+
+    """
+    Retourne les tables du schéma. En mode streaming, chaque table est
+    construite à la demande et n'est pas conservée
+    """
+    def iterTables(self):
+        if not self.streaming:
+            for table in self.dico_table.values():
+                yield table
+            return
+
+        for table in self.tables:
+            table = Table(table, self.namespace, self.naming, self.relations)
+            table.registerNames()
+            yield table
+            self.naming.release(table.name)
+
+    """
+    Retourne les fichiers générés (nom, contenu), table par table
+    """
+    def generate(self):
+        for table in self.iterTables():
+            for renderer in self.renderers:
+                yield renderer.getFilename(table), renderer.render(table)
+
+    def getRelations(self):
+        return self.relations
+
+    """
+    Retourne la liste des collisions de noms détectées dans le schéma
+    """
+    def getCollisions(self):
+        return self.naming.getCollisions()
+
+    """
+    Retourne les avertissements sur le mapping des relations du schéma
+    """
+    def getWarnings(self):
+        return self.naming.getWarnings()
+
+    """
+    Génère tous les fichiers du schéma. En cas d'échec, retourne False
+    et le message d'erreur est disponible dans self.error
+    """
+    def processing(self):
+        try:
+            self.writer.open()
+            try:
+                for filename, content in self.generate():
+                    self.writer.write(filename, content)
+            finally:
+                self.writer.close()
+            return True
+        except:
+            self.error = "Unexpected error : " + str(sys.exc_info()[1])
+            return False
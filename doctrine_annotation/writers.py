@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import sys
+import time
+import codecs
+import tarfile
+import zipfile
+
+
+"""
+Retourne la sortie correspondant à la cible passée en argument :
+"-" pour la sortie standard, un fichier .zip/.tar/.tar.gz/.tgz/.tar.bz2
+pour une archive, un répertoire sinon
+
+:param:     string  target  La cible de la génération
+:return:    object          La sortie à utiliser
+"""
+def createWriter(target):
+    if target == "-":
+        return StreamWriter()
+    if ArchiveWriter.guessFormat(target) is not None:
+        return ArchiveWriter(target)
+    return DirectoryWriter(target)
+
+
+"""
+Classe écrivant chaque fichier généré dans un répertoire
+"""
+class DirectoryWriter:
+    def __init__(self, basepath):
+        self.basepath = basepath
+
+    def open(self):
+        pass
+
+    def write(self, filename, content):
+        path = os.path.join(self.basepath, *filename.split("/"))
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        file = codecs.open(path, "w", "utf-8")
+        file.write(content)
+        file.close()
+
+    def close(self):
+        pass
+
+
+"""
+Classe écrivant tous les fichiers générés dans une seule archive zip ou tar.
+La cible peut être un chemin ou un flux déjà ouvert (tar uniquement, écrit
+séquentiellement : il peut donc s'agir d'un pipe ou de la sortie standard)
+"""
+class ArchiveWriter:
+    formats = [
+        (".zip", "zip"),
+        (".tar", "tar"),
+        (".tar.gz", "tar:gz"),
+        (".tgz", "tar:gz"),
+        (".tar.bz2", "tar:bz2"),
+    ]
+
+    def __init__(self, target, format = None):
+        self.target = target
+        self.format = format if format is not None else self.guessFormat(target)
+        self.archive = None
+        if self.format is None:
+            raise ValueError("Unknown archive format for {0}".format(target))
+
+    @classmethod
+    def guessFormat(cls, target):
+        if not isinstance(target, basestring):
+            return None
+        for extension, format in cls.formats:
+            if target.lower().endswith(extension):
+                return format
+        return None
+
+    def open(self):
+        kind, _, compression = self.format.partition(":")
+        if isinstance(self.target, basestring):
+            directory = os.path.dirname(self.target)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            if kind == "zip":
+                self.archive = zipfile.ZipFile(self.target, "w", zipfile.ZIP_DEFLATED)
+            else:
+                self.archive = tarfile.open(self.target, "w:" + compression)
+        elif kind == "tar":
+            stream = getattr(self.target, "buffer", self.target)
+            self.archive = tarfile.open(fileobj=stream, mode="w|" + compression)
+        else:
+            self.archive = zipfile.ZipFile(self.target, "w", zipfile.ZIP_DEFLATED)
+
+    def write(self, filename, content):
+        data = content.encode("utf-8") if isinstance(content, unicode) else content
+        if isinstance(self.archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(filename, time.localtime()[0:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self.archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(filename)
+            info.size = len(data)
+            info.mtime = time.time()
+            info.mode = 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+
+
+"""
+Classe écrivant tous les fichiers générés dans un flux (la sortie standard par défaut).
+
+Sans délimiteur, chaque fichier est précédé d'une ligne "<taille en octets> <nom>\n".
+Avec un délimiteur, chaque fichier est précédé d'une ligne "<nom>\n" et suivi
+d'une ligne contenant le délimiteur.
+"""
+class StreamWriter:
+    def __init__(self, stream = None, delimiter = None):
+        self.stream = stream
+        self.delimiter = delimiter
+        self.output = None
+
+    def open(self):
+        stream = self.stream if self.stream is not None else sys.stdout
+        self.output = getattr(stream, "buffer", stream)
+
+    def write(self, filename, content):
+        data = content.encode("utf-8") if isinstance(content, unicode) else content
+        filename = self.convertStr(filename)
+        if self.delimiter is None:
+            self.output.write(u"{0} {1}\n".format(len(data), filename).encode("utf-8"))
+            self.output.write(data)
+        else:
+            self.output.write((filename + u"\n").encode("utf-8"))
+            self.output.write(data)
+            self.output.write((u"\n" + self.convertStr(self.delimiter) + u"\n").encode("utf-8"))
+
+    def close(self):
+        if self.output is not None:
+            self.output.flush()
+            self.output = None
+
+    @staticmethod
+    def convertStr(data):
+        if isinstance(data, str):
+            return unicode(data, "utf-8")
+        return data
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+Objets imitant la structure d'un catalogue grt, pour tester le générateur
+en dehors de MySQL Workbench
+"""
+class Node(object):
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+def column(name, type = "INT", not_null = True, auto_increment = False, length = -1):
+    return Node(name=name, simpleType=Node(name=type), userType=None, flags=[],
+                autoIncrement=1 if auto_increment else 0, isNotNull=1 if not_null else 0,
+                length=length, precision=-1, datatypeExplicitParams="", defaultValue="",
+                defaultValueIsNull=0, comment="", owner=None)
+
+
+def table(name, columns, primary = None):
+    result = Node(name=name, columns=[], indices=[], foreignKeys=[])
+    for col in columns:
+        col.owner = result
+        result.columns.append(col)
+    if primary:
+        index(result, "PRIMARY", "PRIMARY", primary)
+    return result
+
+
+def getColumn(table, name):
+    return [col for col in table.columns if col.name == name][0]
+
+
+def index(table, name, type, columns):
+    table.indices.append(Node(name=name, indexType=type, columns=[Node(referencedColumn=getColumn(table, col)) for col in columns]))
+
+
+def foreignKey(table, name, columns, referenced_table, referenced_columns, many = True):
+    table.foreignKeys.append(Node(name=name, many=1 if many else 0,
+                                  columns=[getColumn(table, col) for col in columns],
+                                  referencedTable=referenced_table,
+                                  referencedColumns=[getColumn(referenced_table, col) for col in referenced_columns]))
+
+
+def schema(*tables):
+    return Node(name="test", tables=list(tables))
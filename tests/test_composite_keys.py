@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import io
+import unittest
+
+from doctrine_annotation import Schema, StreamWriter, XmlRenderer
+
+from . import catalog
+
+
+class CompositeKeysTest(unittest.TestCase):
+    def buildSchema(self, *tables):
+        return Schema(catalog.schema(*tables), "", "App", writer=StreamWriter(io.BytesIO()), renderers=[XmlRenderer()])
+
+    def getColumns(self, schema, table_name):
+        return dict((column.property, column) for column in schema.dico_table[table_name].getColumns())
+
+    def testCompositeForeignKeyIsOneAssociation(self):
+        order = catalog.table("order_line", [catalog.column("order_id"), catalog.column("line")], ["order_id", "line"])
+        shipment = catalog.table("shipment", [catalog.column("id", auto_increment=True), catalog.column("order_id"), catalog.column("line")], ["id"])
+        catalog.foreignKey(shipment, "fk_shipment_line", ["order_id", "line"], order, ["order_id", "line"])
+
+        columns = self.getColumns(self.buildSchema(order, shipment), "shipment")
+
+        self.assertEqual(sorted(columns), ["id", "order_line"])
+        self.assertEqual(columns["order_line"].foreign_key.getJoinColumns(), [
+            {"name": "order_id", "referencedColumnName": "order_id"},
+            {"name": "line", "referencedColumnName": "line"},
+        ])
+        self.assertEqual(columns["order_line"].foreign_key.type, "ManyToOne")
+
+    def testForeignKeysSharingTheirFirstColumnAreAllMapped(self):
+        user = catalog.table("user", [catalog.column("tenant_id"), catalog.column("user_id")], ["tenant_id", "user_id"])
+        project = catalog.table("project", [catalog.column("tenant_id"), catalog.column("project_id")], ["tenant_id", "project_id"])
+        task = catalog.table("task", [catalog.column("id"), catalog.column("tenant_id"), catalog.column("user_id"), catalog.column("project_id")], ["id"])
+        catalog.foreignKey(task, "fk_task_user", ["tenant_id", "user_id"], user, ["tenant_id", "user_id"])
+        catalog.foreignKey(task, "fk_task_project", ["tenant_id", "project_id"], project, ["tenant_id", "project_id"])
+
+        schema = self.buildSchema(user, project, task)
+
+        self.assertEqual(sorted(self.getColumns(schema, "task")), ["id", "project", "user"])
+        self.assertEqual(schema.getCollisions(), [])
+        self.assertEqual(len(schema.getWarnings()), 1)
+        self.assertTrue("tenant_id" in schema.getWarnings()[0])
+
+    def testAssociationInsidePrimaryKeyIsIdentifier(self):
+        order = catalog.table("order", [catalog.column("id")], ["id"])
+        line = catalog.table("line", [catalog.column("order_id", auto_increment=True), catalog.column("line_no")], ["order_id", "line_no"])
+        catalog.foreignKey(line, "fk_line_order", ["order_id"], order, ["id"])
+
+        schema = self.buildSchema(order, line)
+        columns = self.getColumns(schema, "line")
+
+        self.assertTrue(columns["order"].is_primary)
+        self.assertTrue(columns["line_no"].is_primary)
+        self.assertFalse(columns["order"].isGenerated())
+        self.assertEqual(schema.getWarnings(), [])
+
+    def testAssociationPartlyInPrimaryKeyIsReported(self):
+        account = catalog.table("account", [catalog.column("tenant_id"), catalog.column("account_id")], ["tenant_id", "account_id"])
+        line = catalog.table("line", [catalog.column("tenant_id"), catalog.column("account_id"), catalog.column("line_no")], ["account_id", "line_no"])
+        catalog.foreignKey(line, "fk_line_account", ["tenant_id", "account_id"], account, ["tenant_id", "account_id"])
+
+        schema = self.buildSchema(account, line)
+        columns = self.getColumns(schema, "line")
+
+        self.assertFalse(columns["account"].is_primary)
+        self.assertTrue(columns["line_no"].is_primary)
+        self.assertEqual(schema.dico_table["line"].getUnmappedPrimaries(), [("account_id", ["fk_line_account"])])
+        self.assertEqual(len(schema.getWarnings()), 1)
+        self.assertTrue("account_id" in schema.getWarnings()[0])
+        self.assertTrue(schema.processing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import io
+import unittest
+
+from doctrine_annotation import Schema, StreamWriter
+
+from . import catalog
+
+
+class StreamingTest(unittest.TestCase):
+    def buildTables(self, count):
+        return [catalog.table("table_%d" % i, [catalog.column("column_%d_%d" % (i, j)) for j in range(5)]) for i in range(count)]
+
+    def testPerTableNamesAreReleased(self):
+        schema = Schema(catalog.schema(*self.buildTables(20)), "", "App", writer=StreamWriter(io.BytesIO()), streaming=True)
+
+        self.assertTrue(schema.processing())
+        self.assertEqual(len(schema.naming.camelcases), 0)
+        self.assertEqual(len(schema.naming.accessors), 0)
+        self.assertEqual(len(schema.naming.members), 0)
+        self.assertEqual(len(schema.naming.class_names), 20)
+
+    def testStreamingMatchesEagerOutput(self):
+        outputs = []
+        for streaming in (False, True):
+            stream = io.BytesIO()
+            schema = Schema(catalog.schema(*self.buildTables(3)), "", "App", writer=StreamWriter(stream, "--"), streaming=streaming)
+            self.assertTrue(schema.processing())
+            outputs.append(sorted(stream.getvalue().split("\n--\n")))
+
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()